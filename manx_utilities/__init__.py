@@ -4,9 +4,21 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
-
-from .const import DOMAIN
+from homeassistant.const import (
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    Platform,
+)
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    CONF_COST_RESOURCE_ID,
+    CONF_ENERGY_RESOURCE_ID,
+    STORAGE_VERSION,
+    STORAGE_KEY,
+)
+from .api import ManxUtilitiesAPI
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,7 +27,23 @@ PLATFORMS = [Platform.SENSOR]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Manx Utilities from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    
+
+    api = ManxUtilitiesAPI(
+        entry.data[CONF_USERNAME],
+        entry.data[CONF_PASSWORD],
+        entry.data[CONF_COST_RESOURCE_ID],
+        entry.data[CONF_ENERGY_RESOURCE_ID],
+        store=Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}"),
+    )
+    # Restore readings from before the restart so totals are correct immediately
+    await api.async_load()
+    if not api.has_history:
+        # Backfilling can take a while, don't hold up setup waiting for it
+        entry.async_create_background_task(
+            hass, api.async_backfill_history(), f"{DOMAIN}_backfill_{entry.entry_id}"
+        )
+    hass.data[DOMAIN][entry.entry_id] = api
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -24,6 +52,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        api = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if api is not None:
+            await api.close()
+
+    return unload_ok
 
-    return unload_ok
\ No newline at end of file
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored readings of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}").async_remove()
\ No newline at end of file
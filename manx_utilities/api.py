@@ -1,42 +1,200 @@
 """API client for Manx Utilities."""
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Tuple, Literal
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Literal
 import aiohttp
+import orjson
 from collections import deque
 
-from .const import API_ENDPOINT, APPLICATION_ID
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    API_ENDPOINT,
+    APPLICATION_ID,
+    TOKEN_LIFETIME,
+    TOKEN_EXPIRY_MARGIN,
+    REQUEST_TIMEOUT,
+    POLL_DELAY_MARGIN,
+    HISTORY_RETENTION,
+    HISTORY_MAXLEN,
+    STORAGE_SAVE_DELAY,
+    VALUE_SCALE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reading periods and delay in seconds, and the fixed offsets built from them
+_PERIOD_SECONDS = 30 * 60
+_PERIOD_END_OFFSET = _PERIOD_SECONDS - 60
+_READING_DELAY_SECONDS = 60 * 60
+_ONE_DAY = timedelta(days=1)
+_SIX_DAYS = timedelta(days=6)
+_READING_DELAY = timedelta(seconds=_READING_DELAY_SECONDS)
+
+# Running total names paired with the name of the period key they belong to
+_PERIODS = (("today", "today_key"), ("week", "week_key"), ("month", "month_key"))
+
+# One client session per event loop, shared by every API client with a user count
+_SHARED_SESSIONS: Dict[asyncio.AbstractEventLoop, List] = {}
+
+def _json_dumps(obj) -> str:
+    """Serialise request bodies with orjson."""
+    return orjson.dumps(obj).decode()
+
+def _acquire_session() -> aiohttp.ClientSession:
+    """Get the shared client session for the running event loop."""
+    loop = asyncio.get_running_loop()
+    shared = _SHARED_SESSIONS.get(loop)
+    if shared is None or shared[0].closed:
+        # Keep connections alive between polls so the TLS session is reused
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=4,
+                limit_per_host=4,
+                keepalive_timeout=300,
+                ttl_dns_cache=600,
+                force_close=False
+            ),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            json_serialize=_json_dumps
+        )
+        shared = _SHARED_SESSIONS[loop] = [session, 0]
+    shared[1] += 1
+    return shared[0]
+
+async def _release_session(session: aiohttp.ClientSession) -> None:
+    """Release a shared client session, closing it once it has no users."""
+    for loop, shared in list(_SHARED_SESSIONS.items()):
+        if shared[0] is session:
+            shared[1] -= 1
+            if shared[1] > 0:
+                return
+            del _SHARED_SESSIONS[loop]
+            break
+    await session.close()
+
+def _format_utc(timestamp: int) -> str:
+    """Format an epoch timestamp as a UTC time string for the API."""
+    tm = time.gmtime(timestamp)
+    return "%04d-%02d-%02dT%02d:%02d:%02d" % (
+        tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min, tm.tm_sec
+    )
+
+def _day_span(moment: datetime) -> Tuple[int, int]:
+    """Get the start and end epoch timestamps of the local day containing a time."""
+    day_start = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    return int(day_start.timestamp()), int((day_start + _ONE_DAY).timestamp())
+
+@lru_cache(maxsize=64)
+def _today_label(day_ordinal: int) -> str:
+    """Get the display label for a day."""
+    return date.fromordinal(day_ordinal).strftime("%d %B %Y")
+
+@lru_cache(maxsize=64)
+def _week_label(iso_year: int, iso_week: int) -> str:
+    """Get the display label for an ISO week (Monday to Sunday)."""
+    week_start = date.fromisocalendar(iso_year, iso_week, 1)
+    week_end = week_start + _SIX_DAYS
+    return f"{week_start.strftime('%d %b')} - {week_end.strftime('%d %b %Y')}"
+
+@lru_cache(maxsize=64)
+def _month_label(year: int, month: int) -> str:
+    """Get the display label for a month."""
+    return date(year, month, 1).strftime("%B %Y")
+
+class ManxUtilitiesApiError(Exception):
+    """Error returned by the Manx Utilities API."""
+
 class ManxUtilitiesAPI:
     """API client for Manx Utilities."""
 
-    def __init__(self, username: str, password: str, cost_resource_id: str, energy_resource_id: str):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        cost_resource_id: str,
+        energy_resource_id: str,
+        store: Optional[Store] = None
+    ):
         """Initialize the API client."""
+        self._store = store
         self._username = username
         self._password = password
         self._cost_resource_id = cost_resource_id
         self._energy_resource_id = energy_resource_id
         self._token = None
+        self._token_expires_at = 0.0
         self._session = None
         self._last_valid_reading = None
+        # Request URLs and headers only change when the token is refreshed
+        self._auth_url = f"{API_ENDPOINT}/auth"
+        self._urls = {
+            "cost": f"{API_ENDPOINT}/resource/{cost_resource_id}/readings",
+            "energy": f"{API_ENDPOINT}/resource/{energy_resource_id}/readings"
+        }
+        self._auth_headers = {
+            "applicationid": APPLICATION_ID,
+            "content-type": "application/json"
+        }
+        self._headers = {**self._auth_headers, "Authorization": ""}
+        self._auth_lock = asyncio.Lock()
+        self._fetch_locks = {
+            "cost": asyncio.Lock(),
+            "energy": asyncio.Lock()
+        }
         # Store readings with timestamps for historical tracking
         self._historical_values = {
-            "cost": deque(maxlen=2880),  # 30 days of 30-minute readings
-            "energy": deque(maxlen=2880)  # 30 days of 30-minute readings
+            "cost": deque(maxlen=HISTORY_MAXLEN),
+            "energy": deque(maxlen=HISTORY_MAXLEN)
+        }
+        # Running totals for the period each reading falls in, keyed by period,
+        # in thousandths of a reading unit so they add up without float error
+        self._running_totals = {
+            reading_type: {
+                "today": 0,
+                "week": 0,
+                "month": 0,
+                "today_key": None,
+                "week_key": None,
+                "month_key": None,
+                "day_span": (None, None),
+            }
+            for reading_type in ("cost", "energy")
+        }
+        # Epoch span of the current day with its period keys and labels
+        self._current_periods = (None, None, None, None)
+        # Current 30-minute period start and its formatted time range
+        self._time_range = (None, None)
+        # Last reading for each type, keyed by the time range it was fetched for
+        self._window_cache = {
+            "cost": (None, None),
+            "energy": (None, None)
         }
 
-    async def authenticate(self) -> None:
-        """Authenticate with the API."""
+    async def authenticate(self, stale_token: Optional[str] = None) -> None:
+        """Authenticate with the API.
+
+        Safe to call concurrently: callers are serialised on a lock and a
+        still-valid token is reused, unless it is the stale_token the API
+        has just rejected.
+        """
+        async with self._auth_lock:
+            if (
+                self._token is not None
+                and self._token != stale_token
+                and time.monotonic() < self._token_expires_at - TOKEN_EXPIRY_MARGIN
+            ):
+                return
+            await self._authenticate()
+
+    async def _authenticate(self) -> None:
+        """Request a new token from the API."""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = _acquire_session()
 
-        auth_url = f"{API_ENDPOINT}/auth"
-        headers = {
-            "applicationid": APPLICATION_ID,
-            "content-type": "application/json"
-        }
         data = {
             "username": self._username,
             "password": self._password
@@ -44,7 +202,7 @@ class ManxUtilitiesAPI:
 
         _LOGGER.debug("Attempting authentication to Manx Utilities API")
         try:
-            async with self._session.post(auth_url, headers=headers, json=data) as response:
+            async with self._session.post(self._auth_url, headers=self._auth_headers, json=data) as response:
                 _LOGGER.debug("Auth response status: %s", response.status)
                 if response.status != 200:
                     response_text = await response.text()
@@ -53,9 +211,11 @@ class ManxUtilitiesAPI:
                         response.status,
                         response_text
                     )
-                    raise Exception(f"Authentication failed: {response_text}")
-                result = await response.json()
+                    raise ManxUtilitiesApiError(f"Authentication failed: {response_text}")
+                result = orjson.loads(await response.read())
                 self._token = result.get("token")
+                self._headers["Authorization"] = f"Bearer {self._token}"
+                self._token_expires_at = time.monotonic() + TOKEN_LIFETIME
                 _LOGGER.debug("Successfully authenticated with Manx Utilities API")
         except aiohttp.ClientError as err:
             _LOGGER.error("Network error during authentication: %s", str(err))
@@ -68,89 +228,199 @@ class ManxUtilitiesAPI:
 
     def _get_time_range(self) -> Tuple[str, str]:
         """Get the appropriate time range for the current 30-minute period."""
-        # Account for the 1-hour delay by looking back an hour
-        now = datetime.utcnow() - timedelta(hours=1)
-        
-        # Determine which 30-minute period we're in
-        if now.minute >= 30:
-            # For the second half of the hour (30-59 minutes)
-            from_time = now.replace(minute=30, second=0, microsecond=0)
-            to_time = from_time + timedelta(minutes=29)
-        else:
-            # For the first half of the hour (0-29 minutes)
-            from_time = now.replace(minute=0, second=0, microsecond=0)
-            to_time = from_time + timedelta(minutes=29)
-        
-        # Format times as strings
-        from_str = from_time.strftime("%Y-%m-%dT%H:%M:%S")
-        to_str = to_time.strftime("%Y-%m-%dT%H:%M:%S")
-        
+        # Account for the 1-hour delay by looking back an hour, then round
+        # down to the start of the 30-minute period we're in
+        period_start = (int(time.time()) - _READING_DELAY_SECONDS) // _PERIOD_SECONDS * _PERIOD_SECONDS
+        if self._time_range[0] == period_start:
+            return self._time_range[1]
+
+        # Format times as strings, the period ends 29 minutes after it starts
+        from_str = _format_utc(period_start)
+        to_str = _format_utc(period_start + _PERIOD_END_OFFSET)
+
+        self._time_range = (period_start, (from_str, to_str))
         return from_str, to_str
 
+    def next_poll_delay(self) -> float:
+        """Get the seconds until the next 30-minute period's reading is due."""
+        return _PERIOD_SECONDS - time.time() % _PERIOD_SECONDS + POLL_DELAY_MARGIN
+
+    @staticmethod
+    def _period_keys(moment: datetime) -> dict:
+        """Get the day, week and month keys for a point in time."""
+        return {
+            "today": moment.toordinal(),
+            "week": tuple(moment.isocalendar()[:2]),
+            "month": (moment.year, moment.month),
+        }
+
+    def _append_reading(self, reading_type: Literal["cost", "energy"], timestamp: int, value: float) -> bool:
+        """Store a reading and add it to the running period totals.
+
+        Returns False without storing anything if the reading is not newer
+        than the last stored one, so each 30-minute period is counted once.
+        """
+        history = self._historical_values[reading_type]
+        if history and history[-1][0] >= timestamp:
+            return False
+        history.append((timestamp, value))
+
+        # Evict readings too old to fall in any period we total
+        cutoff = timestamp - HISTORY_RETENTION
+        while history[0][0] < cutoff:
+            history.popleft()
+
+        running = self._running_totals[reading_type]
+        scaled_value = round(value * VALUE_SCALE)
+        day_start, day_end = running["day_span"]
+        if day_start is not None and day_start <= timestamp < day_end:
+            # Same day as the running totals, so the same week and month too
+            running["today"] += scaled_value
+            running["week"] += scaled_value
+            running["month"] += scaled_value
+            return True
+
+        reading_time = datetime.fromtimestamp(timestamp)
+        reading_keys = self._period_keys(reading_time)
+        for period, key_name in _PERIODS:
+            key = reading_keys[period]
+            current_key = running[key_name]
+            if current_key is None or key > current_key:
+                # Reading starts a new period, roll the total over
+                running[key_name] = key
+                running[period] = 0
+            elif key < current_key:
+                # Reading belongs to a period that has already ended
+                continue
+            running[period] += scaled_value
+
+        if running["today_key"] == reading_keys["today"]:
+            # Remember the day's epoch span to skip the conversion next time
+            running["day_span"] = _day_span(reading_time)
+
+        return True
+
+    def _rebuild_running_totals(self, reading_type: Literal["cost", "energy"]) -> None:
+        """Recalculate the running totals for the current periods from stored readings."""
+        current_time = datetime.now()
+        current_keys = self._period_keys(current_time)
+        today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today_start - timedelta(days=today_start.weekday())
+        month_start = today_start.replace(day=1)
+
+        # Compare epoch timestamps directly instead of converting every reading
+        today_epoch = int(today_start.timestamp())
+        week_epoch = int(week_start.timestamp())
+        month_epoch = int(month_start.timestamp())
+
+        # Accumulate in locals, the loop may visit every stored reading
+        history = self._historical_values[reading_type]
+        total_today = total_week = total_month = 0
+        # Readings are stored oldest first, so walk back from the newest and
+        # stop at the first one older than every period we total
+        oldest_epoch = min(week_epoch, month_epoch)
+        for timestamp, value in reversed(history):
+            if timestamp < oldest_epoch:
+                break
+            scaled_value = round(value * VALUE_SCALE)
+            if timestamp >= today_epoch:
+                total_today += scaled_value
+            if timestamp >= week_epoch:
+                total_week += scaled_value
+            if timestamp >= month_epoch:
+                total_month += scaled_value
+
+        self._running_totals[reading_type] = {
+            "today": total_today,
+            "week": total_week,
+            "month": total_month,
+            "today_key": current_keys["today"],
+            "week_key": current_keys["week"],
+            "month_key": current_keys["month"],
+            "day_span": _day_span(today_start),
+        }
+
+    def _get_current_periods(self) -> Tuple[dict, dict]:
+        """Get the current period keys and labels, recomputed once a day."""
+        now = time.time()
+        day_start, day_end, current_keys, labels = self._current_periods
+        if day_start is not None and day_start <= now < day_end:
+            return current_keys, labels
+
+        current_time = datetime.fromtimestamp(now)
+        current_keys = self._period_keys(current_time)
+        labels = {
+            "today_date": _today_label(current_keys["today"]),
+            "current_week": _week_label(*current_keys["week"]),
+            "current_month": _month_label(*current_keys["month"])
+        }
+        self._current_periods = (*_day_span(current_time), current_keys, labels)
+        return current_keys, labels
+
     def get_historical_totals(self, reading_type: Literal["cost", "energy"]) -> dict:
         """Get historical totals for different time periods."""
-        current_time = datetime.now()
+        current_keys, labels = self._get_current_periods()
         totals = {
             "total_today": 0.0,
             "total_7d": 0.0,
             "total_month": 0.0,
-            "today_date": current_time.strftime("%d %B %Y"),
-            "current_week": "",
-            "current_month": current_time.strftime("%B %Y")
+            **labels
         }
 
-        if not self._historical_values[reading_type]:
-            return totals
-
-        # Calculate today's total (midnight to now)
-        today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # Calculate week start (Monday)
-        week_start = current_time - timedelta(days=current_time.weekday())
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_end = week_start + timedelta(days=6)
-        totals["current_week"] = f"{week_start.strftime('%d %b')} - {week_end.strftime('%d %b %Y')}"
-
-        # Calculate month start
-        month_start = current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        # Calculate totals
-        for timestamp, value in self._historical_values[reading_type]:
-            reading_time = datetime.fromtimestamp(timestamp)
-            
-            if reading_time >= today_start:
-                totals["total_today"] += value
-            
-            if reading_time >= week_start:
-                totals["total_7d"] += value
-                
-            if reading_time >= month_start:
-                totals["total_month"] += value
-
-        # Round totals
-        totals["total_today"] = round(totals["total_today"], 3)
-        totals["total_7d"] = round(totals["total_7d"], 3)
-        totals["total_month"] = round(totals["total_month"], 3)
+        # Only report running totals that belong to the current periods
+        running = self._running_totals[reading_type]
+        if running["today_key"] == current_keys["today"]:
+            totals["total_today"] = running["today"] / VALUE_SCALE
+        if running["week_key"] == current_keys["week"]:
+            totals["total_7d"] = running["week"] / VALUE_SCALE
+        if running["month_key"] == current_keys["month"]:
+            totals["total_month"] = running["month"] / VALUE_SCALE
 
         return totals
 
     async def get_reading(self, reading_type: Literal["cost", "energy"]) -> Optional[Tuple[int, float]]:
         """Get the latest reading from the API for specified type."""
-        if self._token is None:
-            _LOGGER.debug("No token found, authenticating first")
-            await self.authenticate()
+        await self.authenticate()
+
+        return await self._fetch(reading_type)
+
+    async def get_readings(self) -> dict:
+        """Get the latest cost and energy readings concurrently.
+
+        Each value is the reading tuple, None, or the exception raised while
+        fetching that reading type.
+        """
+        # Authenticate once up front so both requests share the same token
+        await self.authenticate()
+
+        cost, energy = await asyncio.gather(
+            self._fetch("cost"),
+            self._fetch("energy"),
+            return_exceptions=True
+        )
+        return {"cost": cost, "energy": energy}
 
+    async def _fetch(self, reading_type: Literal["cost", "energy"]) -> Optional[Tuple[int, float]]:
+        """Fetch and parse the reading for the current period.
+
+        Concurrent fetches of the same reading type share one request: later
+        callers wait for the first and then get its cached reading.
+        """
+        async with self._fetch_locks[reading_type]:
+            return await self._fetch_reading(reading_type)
+
+    async def _fetch_reading(self, reading_type: Literal["cost", "energy"]) -> Optional[Tuple[int, float]]:
+        """Fetch the reading for the current period unless it is already cached."""
         # Get the appropriate time range
-        from_time, to_time = self._get_time_range()
-        
-        resource_id = self._cost_resource_id if reading_type == "cost" else self._energy_resource_id
+        time_range = self._get_time_range()
+        cached_range, cached_reading = self._window_cache[reading_type]
+        if cached_range == time_range and cached_reading is not None:
+            # Readings only advance every 30 minutes, reuse the one we have
+            return cached_reading
+
+        from_time, to_time = time_range
         
-        readings_url = f"{API_ENDPOINT}/resource/{resource_id}/readings"
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "applicationid": APPLICATION_ID,
-            "content-type": "application/json"
-        }
+        readings_url = self._urls[reading_type]
         
         params = {
             "from": from_time,
@@ -160,64 +430,199 @@ class ManxUtilitiesAPI:
         }
 
         _LOGGER.debug(
-            "Requesting %s readings for period from %s to %s using resource_id: %s", 
+            "Requesting %s readings for period from %s to %s using %s", 
             reading_type,
             from_time,
             to_time,
-            resource_id
+            readings_url
         )
 
         try:
-            async with self._session.get(readings_url, headers=headers, params=params) as response:
+            data = await self._request_with_retry(readings_url, params)
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Network error while getting %s readings: %s", reading_type, str(err))
+            raise
+
+        _LOGGER.debug("Received readings data: %s", data)
+        
+        readings = data.get("data")
+        if readings:
+            # Take just the timestamp and value, ignore any additional values
+            timestamp, value = readings[0][:2]
+            if value > 0:  # Only store valid readings
+                history = self._historical_values[reading_type]
+                if history and timestamp - history[-1][0] > _PERIOD_SECONDS:
+                    # Readings were missed since the last poll, fill the gap
+                    # first so they aren't dropped from the totals
+                    try:
+                        await self.backfill(
+                            reading_type,
+                            datetime.fromtimestamp(history[-1][0]),
+                            datetime.fromtimestamp(timestamp)
+                        )
+                    except (ManxUtilitiesApiError, aiohttp.ClientError, asyncio.TimeoutError) as err:
+                        # Don't store the reading, so the gap is retried next poll
+                        _LOGGER.warning("Unable to backfill %s readings: %s", reading_type, err)
+                        return timestamp, float(value)
+                if self._append_reading(reading_type, timestamp, float(value)):
+                    self._schedule_save()
+                self._window_cache[reading_type] = (time_range, (timestamp, float(value)))
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    # Only build the datetime when it will actually be logged
+                    _LOGGER.debug("%s reading - Time: %s, Value: %s", 
+                                  reading_type.capitalize(),
+                                  datetime.fromtimestamp(timestamp), 
+                                  value)
+                return timestamp, float(value)
+        
+        _LOGGER.warning("No valid readings found in response")
+        return None
+
+    async def _request_with_retry(self, url: str, params: dict) -> dict:
+        """Get a URL and return the decoded JSON, reauthenticating once on a 401."""
+        for attempt in range(2):
+            token = self._token
+            async with self._session.get(url, headers=self._headers, params=params) as response:
                 _LOGGER.debug("Readings response status: %s", response.status)
-                if response.status == 401:
-                    _LOGGER.debug("Token expired, reauthenticating")
-                    await self.authenticate()
-                    # Retry the request with new token
-                    headers["Authorization"] = f"Bearer {self._token}"
-                    async with self._session.get(readings_url, headers=headers, params=params) as retry_response:
-                        if retry_response.status != 200:
-                            response_text = await retry_response.text()
-                            _LOGGER.error(
-                                "Failed to get readings after token refresh. Status: %s, Response: %s",
-                                retry_response.status,
-                                response_text
-                            )
-                            raise Exception(f"Failed to get readings: {response_text}")
-                        data = await retry_response.json()
-                elif response.status != 200:
+                if response.status == 200:
+                    return orjson.loads(await response.read())
+                if response.status != 401 or attempt:
                     response_text = await response.text()
                     _LOGGER.error(
                         "Failed to get readings. Status: %s, Response: %s",
                         response.status,
                         response_text
                     )
-                    raise Exception(f"Failed to get readings: {response_text}")
-                else:
-                    data = await response.json()
-
-                _LOGGER.debug("Received readings data: %s", data)
-                
-                if data.get("data") and len(data["data"]) > 0:
-                    # Take just the timestamp and value, ignore any additional values
-                    timestamp, value = data["data"][0][:2]
-                    if value > 0:  # Only store valid readings
-                        self._historical_values[reading_type].append((timestamp, float(value)))
-                        _LOGGER.debug("%s reading - Time: %s, Value: %s", 
-                                    reading_type.capitalize(),
-                                    datetime.fromtimestamp(timestamp), 
-                                    value)
-                        return timestamp, float(value)
-                
-                _LOGGER.warning("No valid readings found in response")
-                return None
+                    raise ManxUtilitiesApiError(f"Failed to get readings: {response_text}")
+            _LOGGER.debug("Token expired, reauthenticating")
+            await self.authenticate(stale_token=token)
+
+    @property
+    def has_history(self) -> bool:
+        """Return whether any readings are stored."""
+        return bool(self._historical_values["cost"] or self._historical_values["energy"])
 
+    async def backfill(
+        self,
+        reading_type: Literal["cost", "energy"],
+        start: datetime,
+        end: datetime
+    ) -> int:
+        """Fetch and store every reading between two times in a single request.
+
+        Naive datetimes are treated as local time. Returns the number of
+        readings stored.
+        """
+        await self.authenticate()
+
+        readings_url = self._urls[reading_type]
+        params = {
+            "from": _format_utc(int(start.timestamp())),
+            "to": _format_utc(int(end.timestamp())),
+            "period": "PT30M",
+            "function": "sum"
+        }
+
+        _LOGGER.debug(
+            "Backfilling %s readings from %s to %s",
+            reading_type,
+            params["from"],
+            params["to"]
+        )
+
+        try:
+            data = await self._request_with_retry(readings_url, params)
         except aiohttp.ClientError as err:
-            _LOGGER.error("Network error while getting %s readings: %s", reading_type, str(err))
+            _LOGGER.error("Network error while backfilling %s readings: %s", reading_type, str(err))
             raise
 
+        history = self._historical_values[reading_type]
+        stored = 0
+        older = []
+        # Readings are only stored in time order, so don't rely on the response order
+        for reading in sorted(data.get("data") or [], key=lambda reading: reading[0]):
+            timestamp, value = reading[:2]
+            if value and value > 0:  # Only store valid readings
+                if self._append_reading(reading_type, timestamp, float(value)):
+                    stored += 1
+                elif timestamp < history[-1][0]:
+                    older.append((timestamp, float(value)))
+
+        # Newer readings may have been stored while the request was running,
+        # merge in any older ones they would otherwise shadow and recount
+        stored_timestamps = {timestamp for timestamp, _ in history} if older else ()
+        older = [reading for reading in older if reading[0] not in stored_timestamps]
+        if older:
+            merged = sorted([*history, *older])
+            history.clear()
+            history.extend(merged)
+            self._rebuild_running_totals(reading_type)
+            stored += len(older)
+
+        _LOGGER.debug("Backfilled %s %s readings", stored, reading_type)
+        if stored:
+            self._schedule_save()
+        return stored
+
+    async def async_backfill_history(self) -> None:
+        """Backfill the readings for the current week and month."""
+        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today_start - timedelta(days=today_start.weekday())
+        month_start = today_start.replace(day=1)
+        # Readings are delayed by an hour
+        end = datetime.now() - _READING_DELAY
+
+        results = await asyncio.gather(
+            self.backfill("cost", min(week_start, month_start), end),
+            self.backfill("energy", min(week_start, month_start), end),
+            return_exceptions=True
+        )
+        for reading_type, result in zip(("cost", "energy"), results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Unable to backfill %s readings: %s", reading_type, result)
+
+    async def async_load(self) -> None:
+        """Restore stored readings and rebuild the running totals."""
+        if self._store is None:
+            return
+
+        data = await self._store.async_load()
+        if not data:
+            return
+
+        for reading_type in ("cost", "energy"):
+            self._historical_values[reading_type].extend(
+                (timestamp, value) for timestamp, value in data.get(reading_type, [])
+            )
+            self._rebuild_running_totals(reading_type)
+        _LOGGER.debug(
+            "Restored %s cost and %s energy readings",
+            len(self._historical_values["cost"]),
+            len(self._historical_values["energy"])
+        )
+
+    def _history_data(self) -> dict:
+        """Get the stored readings in their persisted form."""
+        return {
+            "cost": list(self._historical_values["cost"]),
+            "energy": list(self._historical_values["energy"])
+        }
+
+    def _schedule_save(self) -> None:
+        """Persist stored readings shortly, batching saves for nearby readings."""
+        if self._store is not None:
+            self._store.async_delay_save(self._history_data, STORAGE_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Persist stored readings so totals survive a restart."""
+        if self._store is None:
+            return
+
+        await self._store.async_save(self._history_data())
+
     async def close(self) -> None:
         """Close the API client."""
+        await self.async_save()
         if self._session:
-            await self._session.close()
+            await _release_session(self._session)
             self._session = None
\ No newline at end of file
@@ -34,7 +34,10 @@ class ManxUtilitiesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     user_input[CONF_ENERGY_RESOURCE_ID]
                 )
                 # Test authentication
-                await api.authenticate()
+                try:
+                    await api.authenticate()
+                finally:
+                    await api.close()
 
                 return self.async_create_entry(
                     title=f"Manx Utilities ({user_input[CONF_USERNAME]})",
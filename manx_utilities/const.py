@@ -10,6 +10,21 @@ CONF_ENERGY_RESOURCE_ID = "energy_resource_id"
 # API Constants
 API_ENDPOINT = "https://api.manxutilities.im/api/v0-1"
 APPLICATION_ID = "8f56d0c3-351b-43aa-bf86-b49dbacd18dc"
+TOKEN_LIFETIME = 3300  # seconds a token is trusted before reauthenticating
+TOKEN_EXPIRY_MARGIN = 5  # seconds
+REQUEST_TIMEOUT = 30  # seconds
+POLL_DELAY_MARGIN = 60  # seconds after a period boundary before polling
+# Seconds of readings to keep, enough for a month plus the week overlapping its start
+HISTORY_RETENTION = 38 * 24 * 60 * 60
+# One reading per 30-minute period over the retention window
+HISTORY_MAXLEN = HISTORY_RETENTION // 1800
+# Totals are kept as integer thousandths of a reading unit (millipence, Wh)
+VALUE_SCALE = 1000
+
+# Storage Constants
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}_history"
+STORAGE_SAVE_DELAY = 60  # seconds
 
 # Other Constants
 DEFAULT_SCAN_INTERVAL = 30
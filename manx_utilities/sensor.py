@@ -1,7 +1,10 @@
 """Platform for sensor integration."""
+import asyncio
 from datetime import datetime, timedelta
 import logging
 
+import aiohttp
+
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
@@ -9,27 +12,29 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     CONF_USERNAME,
-    CONF_PASSWORD,
     UnitOfEnergy,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.util import Throttle
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
 from .const import (
     DOMAIN,
     DEFAULT_SCAN_INTERVAL,
     ATTR_LAST_READING_TIME,
     ATTR_PERIOD,
-    CONF_COST_RESOURCE_ID,
-    CONF_ENERGY_RESOURCE_ID,
 )
-from .api import ManxUtilitiesAPI
+from .api import ManxUtilitiesAPI, ManxUtilitiesApiError
 
 _LOGGER = logging.getLogger(__name__)
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=30)
+MAX_TIME_BETWEEN_UPDATES = timedelta(hours=6)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -39,26 +44,101 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Manx Utilities sensors."""
     username = config_entry.data[CONF_USERNAME]
-    password = config_entry.data[CONF_PASSWORD]
-    cost_resource_id = config_entry.data[CONF_COST_RESOURCE_ID]
-    energy_resource_id = config_entry.data[CONF_ENERGY_RESOURCE_ID]
+    api = hass.data[DOMAIN][config_entry.entry_id]
 
-    api = ManxUtilitiesAPI(username, password, cost_resource_id, energy_resource_id)
+    # Fetch both readings once and share them between the sensors
+    coordinator = ManxUtilitiesCoordinator(hass, api)
+    await coordinator.async_refresh()
     
     async_add_entities(
         [
-            ManxUtilitiesCostSensor(api, username),
-            ManxUtilitiesEnergySensor(api, username),
-        ],
-        True,
+            ManxUtilitiesCostSensor(coordinator, username),
+            ManxUtilitiesEnergySensor(coordinator, username),
+        ]
     )
 
-class ManxUtilitiesBaseSensor(SensorEntity):
+class ManxUtilitiesCoordinator(DataUpdateCoordinator):
+    """Coordinator fetching the cost and energy readings together."""
+
+    def __init__(self, hass: HomeAssistant, api: ManxUtilitiesAPI) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=MIN_TIME_BETWEEN_UPDATES,
+        )
+        self.api = api
+        # Timestamp of the last reading seen for each reading type
+        self._last_timestamps = {}
+        # Consecutive updates that returned no new reading, missing or unchanged
+        self._stale_updates = 0
+
+    async def _async_update_data(self) -> dict:
+        """Fetch the latest cost and energy readings."""
+        # Retry after the default interval unless both readings arrive
+        self.update_interval = MIN_TIME_BETWEEN_UPDATES
+
+        try:
+            readings = await self.api.get_readings()
+        except (ManxUtilitiesApiError, aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise UpdateFailed(f"Error authenticating: {err}") from err
+
+        errors = {
+            reading_type: reading
+            for reading_type, reading in readings.items()
+            if isinstance(reading, Exception)
+        }
+        if len(errors) == len(readings):
+            raise UpdateFailed(
+                "Error fetching readings: "
+                + "; ".join(f"{reading_type}: {error}" for reading_type, error in errors.items())
+            ) from errors["cost"]
+
+        # One failed reading only makes its own sensor unavailable
+        for reading_type, error in errors.items():
+            _LOGGER.error("Error fetching %s reading: %s", reading_type, error)
+            readings[reading_type] = None
+
+        new_reading = False
+        for reading_type, reading in readings.items():
+            if reading and reading[0] != self._last_timestamps.get(reading_type):
+                self._last_timestamps[reading_type] = reading[0]
+                new_reading = True
+
+        if new_reading:
+            self._stale_updates = 0
+            if all(readings.values()):
+                # Wait for the next 30-minute reading rather than polling for it
+                self.update_interval = timedelta(seconds=self.api.next_poll_delay())
+        elif self._stale_updates == 0:
+            # Nothing new yet, try again when the next reading is due
+            self._stale_updates = 1
+            self.update_interval = timedelta(seconds=self.api.next_poll_delay())
+        else:
+            # Readings have stopped arriving, back off until they do. Missed
+            # readings are backfilled once they arrive again
+            self.update_interval = min(
+                MIN_TIME_BETWEEN_UPDATES * 2 ** self._stale_updates,
+                MAX_TIME_BETWEEN_UPDATES,
+            )
+            if self.update_interval < MAX_TIME_BETWEEN_UPDATES:
+                self._stale_updates += 1
+
+        return readings
+
+class ManxUtilitiesBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Manx Utilities sensors."""
 
-    def __init__(self, api: ManxUtilitiesAPI, username: str) -> None:
+    _reading_type: str
+    # Reading values are divided by this and rounded to the precision
+    _value_divisor: int
+    _value_precision: int
+
+    def __init__(self, coordinator: ManxUtilitiesCoordinator, username: str) -> None:
         """Initialize the base sensor."""
-        self._api = api
+        super().__init__(coordinator)
+        self._api = coordinator.api
         self._attr_available = True
         self._attr_extra_state_attributes = {
             ATTR_LAST_READING_TIME: None,
@@ -70,10 +150,50 @@ class ManxUtilitiesBaseSensor(SensorEntity):
             "current_week": "",
             "current_month": "",
         }
+        # Last reading timestamp and its ISO formatted local time
+        self._iso_cache = (None, None)
+        self._update_from_reading()
+
+    @property
+    def available(self) -> bool:
+        """Return if the last update succeeded and returned a reading."""
+        return super().available and self._attr_available
+
+    def _reading_time_iso(self, timestamp: int) -> str:
+        """Get the ISO formatted local time of a reading timestamp."""
+        if self._iso_cache[0] != timestamp:
+            self._iso_cache = (timestamp, datetime.fromtimestamp(timestamp).isoformat())
+        return self._iso_cache[1]
+
+    def _update_from_reading(self) -> None:
+        """Update the sensor state from the coordinator's latest reading."""
+        reading_data = (self.coordinator.data or {}).get(self._reading_type)
+        if reading_data and len(reading_data) >= 2:
+            timestamp, value = reading_data
+            self._attr_native_value = round(float(value) / self._value_divisor, self._value_precision)
+            # Replace the attributes in one assignment, with historical totals from API
+            self._attr_extra_state_attributes = {
+                ATTR_LAST_READING_TIME: self._reading_time_iso(timestamp),
+                ATTR_PERIOD: "30 minutes",
+                **self._api.get_historical_totals(self._reading_type),
+            }
+            self._attr_available = True
+        else:
+            self._attr_available = False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_reading()
+        super()._handle_coordinator_update()
 
 class ManxUtilitiesCostSensor(ManxUtilitiesBaseSensor):
     """Representation of a Manx Utilities cost sensor."""
 
+    _reading_type = "cost"
+    # Costs are read in pence and shown in pounds
+    _value_divisor = 100
+    _value_precision = 2
     _attr_has_entity_name = True
     _attr_name = "Electricity Cost"
     _attr_suggested_display_precision = 2
@@ -82,38 +202,17 @@ class ManxUtilitiesCostSensor(ManxUtilitiesBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL
     _attr_icon = "mdi:currency-gbp"
 
-    def __init__(self, api: ManxUtilitiesAPI, username: str) -> None:
+    def __init__(self, coordinator: ManxUtilitiesCoordinator, username: str) -> None:
         """Initialize the sensor."""
-        super().__init__(api, username)
+        super().__init__(coordinator, username)
         self._attr_unique_id = f"manx_utilities_cost_{username}"
 
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            reading_data = await self._api.get_reading("cost")
-            if reading_data and len(reading_data) >= 2:
-                timestamp, cost_pence = reading_data
-                cost_pounds = round(float(cost_pence) / 100, 2)
-                self._attr_native_value = cost_pounds
-                reading_time = datetime.fromtimestamp(timestamp)
-                self._attr_extra_state_attributes[ATTR_LAST_READING_TIME] = reading_time.isoformat()
-                
-                # Get historical totals from API
-                historical_totals = self._api.get_historical_totals("cost")
-                for key, value in historical_totals.items():
-                    self._attr_extra_state_attributes[key] = value
-                
-                self._attr_available = True
-            else:
-                self._attr_available = False
-        except Exception as error:
-            _LOGGER.error("Error updating cost sensor: %s", error)
-            self._attr_available = False
-
 class ManxUtilitiesEnergySensor(ManxUtilitiesBaseSensor):
     """Representation of a Manx Utilities energy sensor."""
 
+    _reading_type = "energy"
+    _value_divisor = 1
+    _value_precision = 3
     _attr_has_entity_name = True
     _attr_name = "Electricity Usage"
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
@@ -121,31 +220,7 @@ class ManxUtilitiesEnergySensor(ManxUtilitiesBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL
     _attr_icon = "mdi:lightning-bolt"
 
-    def __init__(self, api: ManxUtilitiesAPI, username: str) -> None:
+    def __init__(self, coordinator: ManxUtilitiesCoordinator, username: str) -> None:
         """Initialize the sensor."""
-        super().__init__(api, username)
+        super().__init__(coordinator, username)
         self._attr_unique_id = f"manx_utilities_energy_{username}"
-
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            reading_data = await self._api.get_reading("energy")
-            if reading_data and len(reading_data) >= 2:
-                timestamp, energy_kwh = reading_data
-                energy_value = round(float(energy_kwh), 3)
-                self._attr_native_value = energy_value
-                reading_time = datetime.fromtimestamp(timestamp)
-                self._attr_extra_state_attributes[ATTR_LAST_READING_TIME] = reading_time.isoformat()
-                
-                # Get historical totals from API
-                historical_totals = self._api.get_historical_totals("energy")
-                for key, value in historical_totals.items():
-                    self._attr_extra_state_attributes[key] = value
-                
-                self._attr_available = True
-            else:
-                self._attr_available = False
-        except Exception as error:
-            _LOGGER.error("Error updating energy sensor: %s", error)
-            self._attr_available = False
\ No newline at end of file